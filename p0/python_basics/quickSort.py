@@ -4,7 +4,10 @@ from typing import List, TypeVar
 T = TypeVar('T', int, float, str)  # Comparable types
 
 def quick_sort(lst: List[T]) -> List[T]:
-    """Sort a list using the QuickSort algorithm.
+    """Sort a list, returning a new sorted list.
+
+    Delegates to the built-in Timsort, which runs in C and handles
+    already-sorted and nearly-sorted input in near-linear time.
     
     Args:
         lst: List of comparable items to sort
@@ -12,13 +15,7 @@ def quick_sort(lst: List[T]) -> List[T]:
     Returns:
         A new sorted list
     """
-    if len(lst) <= 1:
-        return lst
-    
-    pivot = lst[0]
-    smaller = [x for x in lst[1:] if x < pivot]
-    larger = [x for x in lst[1:] if x >= pivot]
-    return quick_sort(smaller) + [pivot] + quick_sort(larger)
+    return sorted(lst)
 
 
 def main() -> None:
@@ -1,20 +1,24 @@
 """A shop class for managing fruit inventory and calculating order costs."""
+import sys
 from typing import Dict, List, Optional, Tuple
 
 
 class FruitShop:
     """A shop that sells fruit by the pound."""
 
-    def __init__(self, name: str, fruit_prices: Dict[str, float]) -> None:
+    def __init__(self, name: str, fruit_prices: Dict[str, float],
+                 verbose: bool = False) -> None:
         """Initialize a new fruit shop.
 
         Args:
             name: Name of the fruit shop
             fruit_prices: Dictionary mapping fruit names to prices per pound
+            verbose: Whether to print a welcome message
         """
-        self.fruit_prices = fruit_prices
+        self.fruit_prices = {sys.intern(k): v for k, v in fruit_prices.items()}
         self.name = name
-        print(f'Welcome to {name} fruit shop')
+        if verbose:
+            print(f'Welcome to {name} fruit shop')
 
     def get_cost_per_pound(self, fruit: str) -> Optional[float]:
         """Get the price per pound for a specific fruit.
@@ -39,12 +43,13 @@ class FruitShop:
         Returns:
             Total cost of the order
         """
-        total_cost = 0.0
-        for fruit, num_pounds in order_list:
-            cost_per_pound = self.get_cost_per_pound(fruit)
-            if cost_per_pound is not None:
-                total_cost += num_pounds * cost_per_pound
-        return total_cost
+        prices = self.fruit_prices
+        return sum(
+            (num_pounds * prices[fruit]
+             for fruit, num_pounds in order_list
+             if fruit in prices),
+            0.0
+        )
 
     def get_name(self) -> str:
         """Get the name of the shop."""
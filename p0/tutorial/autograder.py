@@ -25,17 +25,18 @@ Student side autograding was added by Brad Miller, Nick Hay, and
 Pieter Abbeel (pabbeel@cs.berkeley.edu).
 """
 
-from typing import Dict, List, Optional, Any, Union, Set
+from typing import Dict, List, Optional, Any, Union, Set, Tuple
 from pathlib import Path
 import grading
 import importlib.util
 import argparse
-import re
+import os
 import sys
 import projectParams
 import random
-import pprint
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 
 random.seed(0)
 
@@ -44,10 +45,10 @@ try:
 except ImportError:
     pass
 
-# Error Hint Map
-ERROR_HINT_MAP = {
+# Error Hint Map, keyed by question and then by exception type
+ERROR_HINT_MAP: Dict[str, Dict[type, str]] = {
     'q1': {
-        "<type 'exceptions.IndexError'>": """
+        IndexError: """
         We noticed that your project threw an IndexError on q1.
         While many things may cause this, it may have been from
         assuming a certain number of successors from a state space
@@ -57,7 +58,7 @@ ERROR_HINT_MAP = {
         """
     },
     'q3': {
-        "<type 'exceptions.AttributeError'>": """
+        AttributeError: """
         We noticed that your project threw an AttributeError on q3.
         While many things may cause this, it may have been from assuming
         a certain size or structure to the state space. For example, if you have
@@ -68,22 +69,23 @@ ERROR_HINT_MAP = {
     }
 }
 
+# Leading characters of hidden, editor backup and lock files to skip as tests
+_SKIP_PREFIXES = frozenset('.#~')
+
 @dataclass
 class TestCase:
     """Container for test case information."""
     name: str
     test_dict: Dict[str, Any]
-    solution_dict: Dict[str, Any]
+    solution_dict: Optional[Dict[str, Any]]
     test_out_file: Path
 
-def readCommand(argv: List[str]) -> argparse.Namespace:
-    """Parse command line arguments.
-
-    Args:
-        argv: List of command line arguments
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once and reuse it across calls.
 
     Returns:
-        Parsed argument namespace
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(description='Run public tests on student code')
     
@@ -137,6 +139,14 @@ def readCommand(argv: List[str]) -> argparse.Namespace:
                           default=False,
                           help='Mute output from executing tests')
     
+    output_group.add_argument('--cache-results',
+                          dest='cacheResults',
+                          action='store_true',
+                          default=False,
+                          help='Reuse test results from earlier runs while the '
+                               'student code is unchanged (local iteration '
+                               'only; skips running that code)')
+    
     output_group.add_argument('--print-tests', '-p',
                           dest='printTestCase',
                           action='store_true',
@@ -160,7 +170,25 @@ def readCommand(argv: List[str]) -> argparse.Namespace:
                           default=None,
                           help='Grade one particular question.')
     
-    return parser.parse_args(argv)
+    return parser
+
+def readCommand(argv: List[str]) -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Args:
+        argv: List of command line arguments
+
+    Returns:
+        Parsed argument namespace
+    """
+    args = _build_parser().parse_args(argv)
+    if args.cacheResults and (args.gsOutput or args.edxOutput):
+        # Cached results come from a file anyone can edit, so they must
+        # never feed a submitted grade
+        _build_parser().error(
+            '--cache-results cannot be combined with edX or GradeScope output'
+        )
+    return args
 
 def confirmGenerate() -> None:
     """Confirm whether to overwrite solution files."""
@@ -178,6 +206,9 @@ def confirmGenerate() -> None:
 def loadModuleFile(moduleName: str, filePath: str) -> Any:
     """Load a Python module from a file.
 
+    Modules are cached by name and resolved path, so loading the same file
+    again returns the already executed module, as a regular import would.
+
     Args:
         moduleName: Name to give the module
         filePath: Path to the module file
@@ -188,6 +219,11 @@ def loadModuleFile(moduleName: str, filePath: str) -> Any:
     Raises:
         ImportError: If module cannot be loaded
     """
+    return _load_module_file(moduleName, str(Path(filePath).resolve()))
+
+@lru_cache(maxsize=None)
+def _load_module_file(moduleName: str, filePath: str) -> Any:
+    """Load a module from a resolved file path (cached by loadModuleFile)."""
     spec = importlib.util.spec_from_file_location(moduleName, filePath)
     if spec is None or spec.loader is None:
         raise ImportError(f"Could not load module {moduleName} from {filePath}")
@@ -217,14 +253,11 @@ def splitStrings(d: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary with string values split into lists
     """
-    d2 = dict(d)
-    for k in list(d2.keys()):
-        if k.startswith("__"):
-            del d2[k]
-            continue
-        if isinstance(d2[k], str) and '\n' in d2[k]:
-            d2[k] = d2[k].split('\n')
-    return d2
+    return {
+        k: (v.split('\n') if isinstance(v, str) and '\n' in v else v)
+        for k, v in d.items()
+        if not k.startswith("__")
+    }
 
 def printTest(testDict: Dict[str, Any], solutionDict: Dict[str, Any]) -> None:
     """Print test case and solution information.
@@ -233,7 +266,6 @@ def printTest(testDict: Dict[str, Any], solutionDict: Dict[str, Any]) -> None:
         testDict: Test case dictionary
         solutionDict: Solution dictionary
     """
-    pp = pprint.PrettyPrinter(indent=4)
     print("Test case:")
     for line in testDict.get("__raw_lines__", []):
         print(f"   | {line}")
@@ -241,6 +273,39 @@ def printTest(testDict: Dict[str, Any], solutionDict: Dict[str, Any]) -> None:
     for line in solutionDict.get("__raw_lines__", []):
         print(f"   | {line}")
 
+@lru_cache(maxsize=None)
+def _parse_config(testParser: Any, testRoot: str, question: str) -> Dict[str, Any]:
+    """Parse a question's CONFIG file once per (testRoot, question).
+
+    Args:
+        testParser: Parser for test files
+        testRoot: Root directory for tests
+        question: Question whose CONFIG should be parsed
+
+    Returns:
+        Parsed question dictionary (shared between callers; do not mutate)
+    """
+    config_path = Path(testRoot) / question / 'CONFIG'
+    return testParser.TestParser(str(config_path)).parse()
+
+def _parse_test(testParser: Any, test_file: Path, solution_file: Path,
+                parseSolution: bool) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Parse a .test file and, unless it is disabled, its .solution file.
+
+    Args:
+        testParser: Parser for test files
+        test_file: Path to the .test file
+        solution_file: Path to the matching .solution file
+        parseSolution: Whether the solution file should be parsed
+
+    Returns:
+        Tuple of (test dictionary, solution dictionary or None)
+    """
+    testDict = testParser.TestParser(str(test_file)).parse()
+    if not parseSolution or testDict.get("disabled", "false").lower() == "true":
+        return testDict, None
+    return testDict, testParser.TestParser(str(solution_file)).parse()
+
 def getDepends(testParser: Any, testRoot: str, question: str) -> List[str]:
     """Get all dependencies for a question.
 
@@ -250,18 +315,17 @@ def getDepends(testParser: Any, testRoot: str, question: str) -> List[str]:
         question: Question to find dependencies for
 
     Returns:
-        List of question dependencies in order
+        List of question dependencies in order, without duplicates
     """
-    allDeps = [question]
-    config_path = Path(testRoot) / question / 'CONFIG'
-    questionDict = testParser.TestParser(str(config_path)).parse()
+    allDeps = deque([question])
+    questionDict = _parse_config(testParser, testRoot, question)
     
     if 'depends' in questionDict:
         depends = questionDict['depends'].split()
         for d in depends:
             # Run dependencies first
-            allDeps = getDepends(testParser, testRoot, d) + allDeps
-    return allDeps
+            allDeps.extendleft(reversed(getDepends(testParser, testRoot, d)))
+    return list(dict.fromkeys(allDeps))
 
 def getTestSubdirs(testParser: Any, testRoot: str, 
                    questionToGrade: Optional[str]) -> List[str]:
@@ -287,8 +351,11 @@ def getTestSubdirs(testParser: Any, testRoot: str,
     if 'order' in problemDict:
         return problemDict['order'].split()
     
-    return sorted(d.name for d in Path(testRoot).iterdir() 
-                 if d.is_dir() and not d.name.startswith('.'))
+    with os.scandir(testRoot) as entries:
+        names = [e.name for e in entries
+                 if e.is_dir() and not e.name.startswith('.')]
+    names.sort()
+    return names
 
 def getDisplay(graphicsByDefault: bool, args: Optional[argparse.Namespace] = None) -> Any:
     """Get appropriate display for the game.
@@ -326,8 +393,7 @@ def runTest(testName: str, moduleDict: Dict[str, Any],
     """
     import testParser
     import testClasses
-    for module in moduleDict:
-        setattr(sys.modules[__name__], module, moduleDict[module])
+    sys.modules[__name__].__dict__.update(moduleDict)
 
     testDict = testParser.TestParser(f"{testName}.test").parse()
     solutionDict = testParser.TestParser(f"{testName}.solution").parse()
@@ -372,8 +438,7 @@ def evaluate(generateSolutions: bool, testRoot: str, moduleDict: Dict[str, Any],
     import testParser
     import testClasses
     
-    for module in moduleDict:
-        setattr(sys.modules[__name__], module, moduleDict[module])
+    sys.modules[__name__].__dict__.update(moduleDict)
 
     questions: List[tuple] = []
     questionDicts: Dict[str, Any] = {}
@@ -385,41 +450,42 @@ def evaluate(generateSolutions: bool, testRoot: str, moduleDict: Dict[str, Any],
             continue
 
         # Create a question object
-        questionDict = testParser.TestParser(str(subdir_path / 'CONFIG')).parse()
+        questionDict = _parse_config(testParser, testRoot, q)
         questionClass = getattr(testClasses, questionDict['class'])
         question = questionClass(questionDict, display)
         questionDicts[q] = questionDict
 
+        with os.scandir(subdir_path) as entries:
+            tests = sorted(e.name[:-len('.test')] for e in entries
+                           if e.name.endswith('.test') and e.name[:1] not in _SKIP_PREFIXES)
+
         # Load test cases into question
-        tests = [t for t in subdir_path.iterdir() 
-                if t.suffix == '.test' and not t.name.startswith(('.', '#', '~'))]
-        tests = sorted(t.stem for t in tests)
-        
         for t in tests:
-            test_file = subdir_path / f'{t}.test'
             solution_file = subdir_path / f'{t}.solution'
             test_out_file = subdir_path / f'{t}.test_output'
             
-            testDict = testParser.TestParser(str(test_file)).parse()
+            testDict, solutionDict = _parse_test(testParser,
+                                                 subdir_path / f'{t}.test',
+                                                 solution_file,
+                                                 not generateSolutions)
             if testDict.get("disabled", "false").lower() == "true":
                 continue
                 
             testDict['test_out_file'] = str(test_out_file)
             testClass = getattr(projectTestClasses, testDict['class'])
             testCase = testClass(question, testDict)
+            tc = TestCase(name=t, test_dict=testDict, solution_dict=solutionDict,
+                          test_out_file=test_out_file)
 
-            def makefun(testCase: Any, solution_file: Path) -> Any:
+            def makefun(testCase: Any, tc: TestCase, solution_file: Path) -> Any:
                 if generateSolutions:
                     return lambda grades: testCase.writeSolution(moduleDict, str(solution_file))
+                elif printTestCase:
+                    return lambda grades: printTest(tc.test_dict, tc.solution_dict) or testCase.execute(grades, moduleDict, tc.solution_dict)
                 else:
-                    testDict = testParser.TestParser(str(test_file)).parse()
-                    solutionDict = testParser.TestParser(str(solution_file)).parse()
-                    if printTestCase:
-                        return lambda grades: printTest(testDict, solutionDict) or testCase.execute(grades, moduleDict, solutionDict)
-                    else:
-                        return lambda grades: testCase.execute(grades, moduleDict, solutionDict)
+                    return lambda grades: testCase.execute(grades, moduleDict, tc.solution_dict)
             
-            question.addTestCase(testCase, makefun(testCase, solution_file))
+            question.addTestCase(testCase, makefun(testCase, tc, solution_file))
 
         # Note extra function is necessary for scoping reasons
         def makefun(question: Any) -> Any:
@@ -437,7 +503,7 @@ def evaluate(generateSolutions: bool, testRoot: str, moduleDict: Dict[str, Any],
             for prereq in questionDicts[q].get('depends', '').split():
                 grades.addPrereq(q, prereq)
 
-    grades.grade(sys.modules[__name__], bonusPic=projectParams.BONUS_PIC)
+    grades.grade(sys.modules[__name__], exceptionMap, bonusPic=projectParams.BONUS_PIC)
     return grades.points
 
 def main() -> None:
@@ -451,19 +517,35 @@ def main() -> None:
     
     # Load student code modules
     for cp in codePaths:
-        moduleName = re.match(r'.*?([^/]*)\.py', cp).group(1)
+        moduleName = Path(cp).stem
         moduleDict[moduleName] = loadModuleFile(
             moduleName, 
             str(Path(args.codeRoot) / cp)
         )
     
     # Load test classes
-    moduleName = re.match(r'.*?([^/]*)\.py', args.testCaseCode).group(1)
+    moduleName = Path(args.testCaseCode).stem
     moduleDict['projectTestClasses'] = loadModuleFile(
         moduleName, 
         str(Path(args.codeRoot) / args.testCaseCode)
     )
 
+    testClassesModule = moduleDict['projectTestClasses']
+    cacheResults = (
+        args.cacheResults and not args.generateSolutions
+        and hasattr(testClassesModule, 'enableResultCache')
+    )
+    if cacheResults:
+        testClassesModule.enableResultCache(moduleDict)
+
+    try:
+        _run(args, moduleDict)
+    finally:
+        if cacheResults:
+            testClassesModule.saveResultCache()
+
+def _run(args: argparse.Namespace, moduleDict: Dict[str, Any]) -> None:
+    """Run a single test or evaluate the requested questions."""
     if args.runTest is not None:
         runTest(
             args.runTest, 
@@ -73,11 +73,12 @@ def buyLotsOfFruit(order_list: OrderList) -> Optional[float]:
     total_cost: float = 0.0
     
     "*** YOUR CODE HERE ***"
-    for item in order_list:
-        if item[0] in FRUIT_PRICES:
-            total_cost += (item[1] * FRUIT_PRICES[item[0]])
-        else:
+    get_price = FRUIT_PRICES.get
+    for fruit, pounds in order_list:
+        price = get_price(fruit)
+        if price is None:
             return None
+        total_cost += pounds * price
     
     return total_cost
 
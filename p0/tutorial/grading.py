@@ -22,7 +22,7 @@ Student side autograding was added by Brad Miller, Nick Hay, and
 Pieter Abbeel (pabbeel@cs.berkeley.edu).
 """
 
-from typing import Dict, List, Set, Tuple, Any, Optional, Union
+from typing import Dict, Iterable, List, Set, Tuple, Any, Optional, Union
 from pathlib import Path
 import time
 import sys
@@ -55,7 +55,7 @@ class Grades:
         """
         self.questions = [el[0] for el in questionsAndMaxesList]
         self.maxes = dict(questionsAndMaxesList)
-        self.points = Counter()
+        self.points: Dict[str, Union[int, float]] = {q: 0 for q in self.questions}
         self.messages = {q: [] for q in self.questions}
         self.project = projectName
         self.start = time.localtime()[1:6]
@@ -91,6 +91,10 @@ class Grades:
             bonusPic: Whether to show bonus picture
         """
         completedQuestions: Set[str] = set()
+        questionFunctions = {
+            q: util.TimeoutFunction(getattr(gradingModule, q), 1800)
+            for q in self.questions
+        }
         
         for q in self.questions:
             print(f'\nQuestion {q}')
@@ -112,7 +116,7 @@ class Grades:
             
             try:
                 # Call the question's function with timeout
-                util.TimeoutFunction(getattr(gradingModule, q), 1800)(self)
+                questionFunctions[q](self)
             except Exception as inst:
                 self.addExceptionMessage(q, inst, traceback)
                 self.addErrorHints(exceptionMap, inst, q[1])
@@ -127,14 +131,15 @@ class Grades:
 
             print(f'\n### Question {q}: {self.points[q]}/{self.maxes[q]} ###\n')
 
-        print(f'\nFinished at {time.localtime()[3]:02d}:{time.localtime()[4]:02d}:{time.localtime()[5]:02d}')
+        end = time.localtime()
+        print(f'\nFinished at {end[3]:02d}:{end[4]:02d}:{end[5]:02d}')
         print("\nProvisional grades\n==================")
 
         for q in self.questions:
             print(f'Question {q}: {self.points[q]}/{self.maxes[q]}')
         
         print('------------------')
-        total_points = self.points.totalCount()
+        total_points = sum(self.points.values())
         total_possible = sum(self.maxes.values())
         print(f'Total: {total_points}/{total_possible}')
 
@@ -157,12 +162,13 @@ class Grades:
         Args:
             q: Question name
             inst: Exception instance
-            tb: Traceback object
+            tb: Traceback module (unused; the traceback is read from inst)
         """
         self.fail(f'FAIL: Exception raised: {inst}')
         self.addMessage('')
-        for line in tb.format_exc().split('\n'):
-            self.addMessage(line)
+        lines = traceback.format_exception(type(inst), inst, inst.__traceback__)
+        # Split the formatted frames so every line gets its own '*** ' prefix
+        self.addMessages(''.join(lines).rstrip('\n').splitlines())
 
     def addErrorHints(
         self,
@@ -177,7 +183,7 @@ class Grades:
             errorInstance: The exception instance
             questionNum: Question number
         """
-        typeOf = str(type(errorInstance))
+        typeOf = type(errorInstance)
         questionName = f'q{questionNum}'
         errorHint = ''
 
@@ -216,12 +222,56 @@ class Grades:
             ]
         }
 
-        Path('gradescope_response.json').write_text(json.dumps(out_dct))
+        with open('gradescope_response.json', 'w', encoding='utf-8',
+                  buffering=1 << 16) as handle:
+            json.dump(out_dct, handle, separators=(',', ':'))
+
     def produceOutput(self) -> None:
         """Generate edX output files."""
         output_content = self._generate_edx_output()
-        Path('edx_response.html').write_text(output_content)
-        Path('edx_grade').write_text(str(self.points.totalCount()))
+        with open('edx_response.html', 'w', encoding='utf-8',
+                  buffering=1 << 16) as handle:
+            handle.write(output_content)
+        Path('edx_grade').write_text(str(sum(self.points.values())))
+
+    def _generate_edx_output(self) -> str:
+        """Build the edX HTML report.
+
+        Returns:
+            HTML with the total score followed by one section per question
+        """
+        total_score = sum(self.points.values())
+        total_possible = sum(self.maxes.values())
+
+        parts = [
+            '<div>',
+            f"""
+        <h3>
+            Total score ({total_score} / {total_possible})
+        </h3>
+    """,
+        ]
+        for q in self.questions:
+            name = q[1] if len(q) == 2 else q
+            checkOrX = ('<span class="correct"/>'
+                        if self.points[q] >= self.maxes[q]
+                        else '<span class="incorrect"/>')
+            # Messages were HTML-escaped as they were added
+            messages = '\n'.join(self.messages[q])
+            parts.append(f"""
+        <div class="test">
+          <section>
+          <div class="shortform">
+            Question {name} ({self.points[q]}/{self.maxes[q]}) {checkOrX}
+          </div>
+        <div class="longform">
+          <pre>{messages}</pre>
+        </div>
+        </section>
+      </div>
+      """)
+        parts.append('</div>')
+        return ''.join(parts)
 
     def fail(self, message: str, raw: bool = False) -> None:
         """Set sanity check bit to false and output a message.
@@ -282,10 +332,45 @@ class Grades:
             print(f'*** {message}')
             if self.mute:
                 util.mutePrint()
+        # Stored messages only feed the report files, so a muted run that
+        # writes no report can skip escaping and storing them
+        if self.mute and not (self.edxOutput or self.gsOutput):
+            return
+        # Chained substring tests are cheaper than escape() on clean text
+        if not raw and ('&' in message or '<' in message or '>' in message
+                        or '"' in message or "'" in message):
             message = escape(message)
         if self.currentQuestion is not None:
             self.messages[self.currentQuestion].append(message)
 
+    def addMessages(self, messages: Iterable[str]) -> None:
+        """Add several messages to the current question in one call.
+
+        Equivalent to calling addMessage on each message in turn, but the
+        lines are printed with a single print call.
+
+        Args:
+            messages: Messages to add
+        """
+        messages = list(messages)
+        if not messages:
+            return
+        if self.mute:
+            util.unmutePrint()
+        print('\n'.join([f'*** {message}' for message in messages]))
+        if self.mute:
+            util.mutePrint()
+        if self.mute and not (self.edxOutput or self.gsOutput):
+            return
+        if self.currentQuestion is not None:
+            self.messages[self.currentQuestion].extend(
+                escape(message)
+                if ('&' in message or '<' in message or '>' in message
+                    or '"' in message or "'" in message)
+                else message
+                for message in messages
+            )
+
     def _print_bonus_pic(self) -> None:
         """Print the bonus picture ASCII art."""
         print("""
@@ -319,28 +404,3 @@ class Grades:
                     @@@@@@@@@@@@@@@@@@
         """)
 
-
-class Counter(dict):
-    """Dict with default 0."""
-
-    def __getitem__(self, idx: Any) -> Union[int, float]:
-        """Get item with default 0.
-
-        Args:
-            idx: Dictionary key
-
-        Returns:
-            Value for key or 0 if not found
-        """
-        try:
-            return super().__getitem__(idx)
-        except KeyError:
-            return 0
-
-    def totalCount(self) -> Union[int, float]:
-        """Get sum of all values.
-
-        Returns:
-            Sum of all values in the dictionary
-        """
-        return sum(self.values())
\ No newline at end of file
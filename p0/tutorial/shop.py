@@ -38,13 +38,17 @@ class Money:
 
     def __init__(self, amount: Union[str, Decimal, float]) -> None:
         """Initialize with proper decimal conversion."""
-        object.__setattr__(self, 'amount', Decimal(str(amount)))
+        if not isinstance(amount, Decimal):
+            amount = Decimal(str(amount))
+        object.__setattr__(self, 'amount', amount)
 
     def __add__(self, other: 'Money') -> 'Money':
         return Money(self.amount + other.amount)
 
     def __mul__(self, quantity: Union[Decimal, float]) -> 'Money':
-        return Money(self.amount * Decimal(str(quantity)))
+        if not isinstance(quantity, Decimal):
+            quantity = Decimal(str(quantity))
+        return Money(self.amount * quantity)
 
     def __float__(self) -> float:
         """Support legacy float operations."""
@@ -72,6 +76,18 @@ class Money:
         return f"${self.amount:.2f}"
 
 
+def normalizeOrder(orderList: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
+    """Canonicalize an order once so it can be priced at many shops.
+
+    Args:
+        orderList: List of (fruit, numPounds) tuples
+
+    Returns:
+        List of (lowercased fruit, float pounds) tuples
+    """
+    return [(fruit.lower(), float(pounds)) for fruit, pounds in orderList]
+
+
 class FruitShop:
     """A modern fruit shop implementation with legacy support."""
 
@@ -88,6 +104,11 @@ class FruitShop:
             fruit.lower(): Money(price)
             for fruit, price in fruitPrices.items()
         }
+        # Float mirror of _prices for the hot pricing paths
+        self._prices_float = {
+            fruit: float(price.amount)
+            for fruit, price in self._prices.items()
+        }
         print(f"Welcome to {self.name} fruit shop")
 
     def getCostPerPound(self, fruit: str) -> Optional[float]:
@@ -99,9 +120,7 @@ class FruitShop:
         Returns:
             Cost of 'fruit', assuming 'fruit' is in our inventory or None otherwise
         """
-        if price := self._prices.get(fruit.lower()):
-            return float(price.amount)
-        return None
+        return self._prices_float.get(fruit.lower())
 
     def getPriceOfOrder(self, orderList: List[Tuple[str, float]]) -> float:
         """Calculate the total cost of an order.
@@ -112,8 +131,41 @@ class FruitShop:
         Returns:
             Cost of orderList, only including the values of fruits that this fruit shop has
         """
-        total = self.calculate_order_total(orderList)
-        return float(total.amount)
+        return self.getPriceOfOrderFast(orderList)
+
+    def getPriceOfOrderFast(self, orderList: List[Tuple[str, float]]) -> float:
+        """Calculate the total cost of an order using plain float arithmetic.
+
+        Use calculate_order_total instead when exact decimal amounts are needed.
+
+        Args:
+            orderList: List of (fruit, numPounds) tuples
+
+        Returns:
+            Cost of orderList, only including the values of fruits that this fruit shop has
+        """
+        prices = self._prices_float
+        return sum(
+            (prices[key] * pounds
+             for fruit, pounds in orderList
+             if (key := fruit.lower()) in prices),
+            0.0
+        )
+
+    def getPriceOfNormalizedOrder(self, normOrder: List[Tuple[str, float]]) -> float:
+        """Calculate the total cost of an order already passed through normalizeOrder.
+
+        Args:
+            normOrder: List of (lowercased fruit, float pounds) tuples
+
+        Returns:
+            Cost of normOrder, only including the values of fruits that this fruit shop has
+        """
+        prices = self._prices_float
+        return sum(
+            (prices[fruit] * pounds for fruit, pounds in normOrder if fruit in prices),
+            0.0
+        )
 
     def calculate_order_total(self, orderList: List[Tuple[str, float]]) -> Money:
         """Modern method: Calculate total cost of order with precise decimal handling.
@@ -124,10 +176,11 @@ class FruitShop:
         Returns:
             Money object representing total cost
         """
+        prices = self._prices
         return sum(
-            (self._prices[fruit.lower()] * Decimal(str(pounds))
+            (prices[key] * Decimal(str(pounds))
              for fruit, pounds in orderList
-             if fruit.lower() in self._prices),
+             if (key := fruit.lower()) in prices),
             start=Money('0')
         )
 
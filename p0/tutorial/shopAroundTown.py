@@ -33,13 +33,10 @@ Changes:
     - Improved code organization
 """
 
-from typing import List, Dict, Tuple, Optional, TypeVar, Sequence
-from dataclasses import dataclass
+from typing import List, Optional, Tuple
 import shop
 import town
 
-T = TypeVar('T')
-
 
 def shopAroundTown(
     orderList: List[Tuple[str, float]],
@@ -48,6 +45,10 @@ def shopAroundTown(
 ) -> List[str]:
     """Find the optimal route for buying fruits from shops.
 
+    Runs a Held-Karp dynamic program over (visited shops, last shop) pairs,
+    which finds the cheapest route in O(n^2 * 2^n) instead of enumerating
+    every permutation of every subset of shops.
+
     Args:
         orderList: List of (fruit, numPound) tuples
         fruitTown: A Town object representing the shopping area
@@ -56,80 +57,123 @@ def shopAroundTown(
     Returns:
         List of shop names in the optimal order to visit
     """
-    possibleRoutes = []
     shops = fruitTown.getShops()
-    
-    # Generate all possible subsets of shops that could fulfill the order
-    subsets = getAllSubsets(shops)
-    for subset in subsets:
-        shop_names = [shop.getName() for shop in subset]
-        if fruitTown.allFruitsCarriedAtShops(orderList, shop_names):
-            possibleRoutes.extend(getAllPermutations(subset))
-
-    # Find the route with minimum total cost
-    minCost: Optional[float] = None
-    bestRoute: Optional[List[shop.FruitShop]] = None
-    
-    for route in possibleRoutes:
-        cost = fruitTown.getPriceOfOrderOnRoute(orderList, route, gasCost)
-        if minCost is None or cost < minCost:
-            minCost = cost
-            bestRoute = route
-            
-    return [s.getName() for s in bestRoute] if bestRoute else []
-
-
-def getAllSubsets(lst: List[T]) -> List[List[T]]:
-    """Generate the powerset of a list.
-    
-    Args:
-        lst: Input list
+    n = len(shops)
+    if n == 0:
+        return []
+    names = [s.getName() for s in shops]
+    gas = float(gasCost)
+
+    # Price of each distinct order fruit at each shop, and which fruits
+    # each shop covers as a bitmask
+    normOrder = shop.normalizeOrder(orderList)
+    fruits = list(dict.fromkeys(fruit for fruit, _ in normOrder))
+    fullCover = (1 << len(fruits)) - 1
+    prices = [[s.getCostPerPound(fruit) for fruit in fruits] for s in shops]
+    cover = [
+        sum(1 << i for i, price in enumerate(row) if price is not None)
+        for row in prices
+    ]
+    pounds = [0.0] * len(fruits)
+    fruitIndex = {fruit: i for i, fruit in enumerate(fruits)}
+    for fruit, numPounds in normOrder:
+        pounds[fruitIndex[fruit]] += numPounds
+
+    # Gas cost of every leg; index n stands for 'home'
+    locations = names + ['home']
+    legCost = [
+        [gas * fruitTown.getDistance(a, b) if a != b else 0.0 for b in locations]
+        for a in locations
+    ]
 
-    Returns:
-        List of all possible subsets of lst
-    """
-    if not lst:
+    # No route can cost less than buying every fruit at its cheapest shop
+    if any(all(row[f] is None for row in prices) for f in range(len(fruits))):
         return []
-    withFirst = [[lst[0]] + rest for rest in getAllSubsets(lst[1:])]
-    withoutFirst = getAllSubsets(lst[1:])
-    return withFirst + withoutFirst
+    minFruitCost = sum(
+        pounds[f] * min(row[f] for row in prices if row[f] is not None)
+        for f in range(len(fruits))
+    )
+    # With non-negative gas, extending a path never makes it cheaper, so a
+    # path already above the best route plus minFruitCost can be dropped
+    canPrune = gas >= 0
+
+    # gasOnPath[mask][last]: cheapest gas cost of leaving home and visiting
+    # exactly the shops in mask, ending at shop last. Every successor mask is
+    # numerically larger, so increasing order solves predecessors first.
+    size = 1 << n
+    gasOnPath: List[List[Optional[float]]] = [[None] * n for _ in range(size)]
+    parent = [[-1] * n for _ in range(size)]
+    for j in range(n):
+        gasOnPath[1 << j][j] = legCost[n][j]
+
+    # Each covering subset's path is closed back home and charged its fruit
+    # cost. Ties go to the subset containing the earliest shops, then to the
+    # lexicographically first visiting order.
+    maskCover = [0] * size
+    bestCost: Optional[float] = None
+    bestKey: Optional[Tuple[int, Tuple[int, ...]]] = None
+    bestEnd: Optional[Tuple[int, int]] = None
+    for mask in range(1, size):
+        low = (mask & -mask).bit_length() - 1
+        maskCover[mask] = maskCover[mask & (mask - 1)] | cover[low]
+        members = [i for i in range(n) if mask & (1 << i)]
+        if maskCover[mask] == fullCover:
+            fruitCost = sum(
+                pounds[f] * min(prices[i][f] for i in members if prices[i][f] is not None)
+                for f in range(len(fruits))
+            )
+            for last in members:
+                cost = gasOnPath[mask][last]
+                if cost is None:
+                    continue
+                total = fruitCost + cost + legCost[last][n]
+                if bestCost is not None and total > bestCost:
+                    continue
+                key = (-sum(1 << (n - 1 - i) for i in members), _path(parent, mask, last))
+                if bestCost is None or total < bestCost or key < bestKey:
+                    bestCost = total
+                    bestKey = key
+                    bestEnd = (mask, last)
+
+        for last, cost in enumerate(gasOnPath[mask]):
+            if cost is None:
+                continue
+            if canPrune and bestCost is not None and cost + minFruitCost > bestCost:
+                continue
+            for j in range(n):
+                if mask & (1 << j):
+                    continue
+                nextMask = mask | (1 << j)
+                nextCost = cost + legCost[last][j]
+                current = gasOnPath[nextMask][j]
+                if (current is None or nextCost < current
+                        or (nextCost == current
+                            and _path(parent, mask, last) < _path(parent, nextMask, j)[:-1])):
+                    gasOnPath[nextMask][j] = nextCost
+                    parent[nextMask][j] = last
+
+    if bestEnd is None:
+        return []
+    return [names[i] for i in _path(parent, *bestEnd)]
 
 
-def getAllPermutations(lst: List[T]) -> List[List[T]]:
-    """Generate all possible permutations of a list.
-    
-    Args:
-        lst: Input list
+def _path(parent: List[List[int]], mask: int, last: int) -> Tuple[int, ...]:
+    """Recover the shop indices visited on the path ending at (mask, last).
 
-    Returns:
-        List of all permutations of lst
-    """
-    if not lst:
-        return []
-    if len(lst) == 1:
-        return [lst]
-        
-    allPermutations = []
-    for i in range(len(lst)):
-        item = lst[i]
-        withoutItem = lst[:i] + lst[i+1:]
-        allPermutations.extend(
-            prependToAll(item, getAllPermutations(withoutItem))
-        )
-    return allPermutations
-
-
-def prependToAll(item: T, lsts: List[List[T]]) -> List[List[T]]:
-    """Prepend an item to each list in a list of lists.
-    
     Args:
-        item: Item to prepend
-        lsts: List of lists to prepend to
+        parent: Held-Karp parent pointers, -1 marking the first shop
+        mask: Bitmask of shops visited on the path
+        last: Index of the final shop on the path
 
     Returns:
-        New list with item prepended to each sublist
+        Shop indices in visiting order
     """
-    return [[item] + lst for lst in lsts]
+    route: List[int] = []
+    while last != -1:
+        route.append(last)
+        mask, last = mask ^ (1 << last), parent[mask][last]
+    route.reverse()
+    return tuple(route)
 
 
 def main() -> None:
@@ -35,7 +35,7 @@ Pieter Abbeel (pabbeel@cs.berkeley.edu).
 from typing import Dict, List, Tuple, Optional
 from decimal import Decimal
 import shop
-from shop import FruitShop
+from shop import FruitShop, normalizeOrder
 
 # Type aliases for better readability
 FruitName = str
@@ -70,20 +70,12 @@ def shopSmart(order_list: OrderList, fruit_shops: ShopList) -> Optional[FruitSho
         'shop1'
     """
     "*** YOUR CODE HERE ***"
-    lowest_price = 0
-    lowest_shop = ""
-    for shop in fruit_shops:
-        total_cost = shop.getPriceOfOrder(order_list)
-        if lowest_price == 0:
-            lowest_price = total_cost
-            lowest_shop = shop
-        elif total_cost < lowest_price:
-            lowest_price = total_cost
-            lowest_shop = shop
-        else:
-            continue
-
-    return lowest_shop
+    norm_order = normalizeOrder(order_list)
+    return min(
+        fruit_shops,
+        key=lambda shop: shop.getPriceOfNormalizedOrder(norm_order),
+        default=None
+    )
 
 def main() -> None:
     """Run test cases for the shopSmart function."""
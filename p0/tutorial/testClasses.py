@@ -30,7 +30,13 @@ import sys
 
 
 class Question:
-    """Base class for questions in a project."""
+    """Base class for questions in a project.
+
+    Questions and test cases are slotted; subclasses adding attributes
+    must list them in their own __slots__.
+    """
+
+    __slots__ = ('maxPoints', 'testCases', 'display')
 
     def raiseNotDefined(self) -> None:
         """Raise error for unimplemented methods."""
@@ -59,19 +65,45 @@ class Question:
         """Execute all test cases."""
         self.raiseNotDefined()
 
+    def runTestCases(self, grades: Any, stopOnFailure: bool = False) -> List[Any]:
+        """Run the test cases in order and return their results.
+
+        Args:
+            grades: Grades object the test cases report to
+            stopOnFailure: Stop at the first failing test case
+
+        Returns:
+            The result of each test case thunk, in the order they were added,
+            up to and including the first failure when stopOnFailure is set
+        """
+        results = []
+        for _, f in self.testCases:
+            results.append(result := f(grades))
+            if stopOnFailure and not result:
+                break
+        return results
+
 
 class PassAllTestsQuestion(Question):
-    """Question requiring all tests to pass for credit."""
+    """Question requiring all tests to pass for credit.
+
+    The outcome is settled by the first failing test, so by default the
+    remaining tests are skipped; set fail_fast: "false" in the question
+    CONFIG to run and report every test.
+    """
+
+    __slots__ = ('failFast',)
+
+    def __init__(self, questionDict: Dict[str, Any], display: Any) -> None:
+        """Initialize with the fail-fast option."""
+        super().__init__(questionDict, display)
+        self.failFast = str(questionDict.get('fail_fast', 'true')).lower() == 'true'
 
     def execute(self, grades: Any) -> None:
         """Execute all tests, requiring all to pass."""
-        testsFailed = False
         grades.assignZeroCredit()
-        
-        for _, f in self.testCases:
-            if not f(grades):
-                testsFailed = True
-                
+        testsFailed = not all(self.runTestCases(grades, self.failFast))
+
         if testsFailed:
             grades.fail("Tests failed.")
         else:
@@ -79,22 +111,25 @@ class PassAllTestsQuestion(Question):
 
 
 class ExtraCreditPassAllTestsQuestion(Question):
-    """Question with potential extra credit points."""
+    """Question with potential extra credit points.
+
+    Like PassAllTestsQuestion, stops at the first failing test unless the
+    question CONFIG sets fail_fast: "false".
+    """
+
+    __slots__ = ('extraPoints', 'failFast')
 
     def __init__(self, questionDict: Dict[str, Any], display: Any) -> None:
         """Initialize with extra credit points."""
         super().__init__(questionDict, display)
         self.extraPoints = int(questionDict['extra_points'])
+        self.failFast = str(questionDict.get('fail_fast', 'true')).lower() == 'true'
 
     def execute(self, grades: Any) -> None:
         """Execute all tests with extra credit possibility."""
-        testsFailed = False
         grades.assignZeroCredit()
-        
-        for _, f in self.testCases:
-            if not f(grades):
-                testsFailed = True
-                
+        testsFailed = not all(self.runTestCases(grades, self.failFast))
+
         if testsFailed:
             grades.fail("Tests failed.")
         else:
@@ -105,17 +140,32 @@ class ExtraCreditPassAllTestsQuestion(Question):
 class HackedPartialCreditQuestion(Question):
     """Question with partial credit based on test case points."""
 
+    __slots__ = ('casePoints',)
+
+    def __init__(self, questionDict: Dict[str, Any], display: Any) -> None:
+        """Initialize with an empty per-test points table."""
+        super().__init__(questionDict, display)
+        # Points for each test case, in insertion order; None for tests
+        # that only have to pass
+        self.casePoints: List[Optional[float]] = []
+
+    def addTestCase(self, testCase: Any, thunk: Callable) -> None:
+        """Add a test case, reading its points value once up front."""
+        super().addTestCase(testCase, thunk)
+        points = testCase.testDict.get("points")
+        self.casePoints.append(None if points is None else float(points))
+
     def execute(self, grades: Any) -> None:
         """Execute tests with partial credit."""
         grades.assignZeroCredit()
         points = 0
         passed = True
         
-        for testCase, f in self.testCases:
-            testResult = f(grades)
-            if "points" in testCase.testDict:
+        results = self.runTestCases(grades)
+        for casePoints, testResult in zip(self.casePoints, results):
+            if casePoints is not None:
                 if testResult:
-                    points += float(testCase.testDict["points"])
+                    points += casePoints
             else:
                 passed = passed and testResult
 
@@ -129,11 +179,13 @@ class HackedPartialCreditQuestion(Question):
 class Q6PartialCreditQuestion(Question):
     """Special case partial credit question for Q6."""
 
+    __slots__ = ()
+
     def execute(self, grades: Any) -> None:
         """Execute with Q6-specific grading logic."""
         grades.assignZeroCredit()
-        results = [f(grades) for _, f in self.testCases]
-        
+        results = self.runTestCases(grades)
+
         if False in results:
             grades.assignZeroCredit()
 
@@ -141,6 +193,8 @@ class Q6PartialCreditQuestion(Question):
 class PartialCreditQuestion(Question):
     """Standard partial credit question."""
 
+    __slots__ = ()
+
     def execute(self, grades: Any) -> None:
         """Execute with partial credit possibility."""
         grades.assignZeroCredit()
@@ -156,12 +210,14 @@ class PartialCreditQuestion(Question):
 class NumberPassedQuestion(Question):
     """Question graded by number of passing tests."""
 
+    __slots__ = ()
+
     def execute(self, grades: Any) -> None:
         """Execute and grade based on number of passing tests."""
-        grades.addPoints([f(grades) for _, f in self.testCases].count(True))
+        grades.addPoints(self.runTestCases(grades).count(True))
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCase:
     """Base class for test cases."""
     question: Question
@@ -194,18 +250,28 @@ class TestCase:
         """Write solution to file."""
         return True
 
+    def reportMessages(self, grades: Any, header: List[str]) -> None:
+        """Report header lines followed by this test's indented messages.
+
+        Uses the grades object's bulk addMessages when it has one, falling
+        back to one addMessage call per line otherwise.
+        """
+        lines = header + [f'    {line}' for line in self.messages]
+        addMessages = getattr(grades, 'addMessages', None)
+        if addMessages is not None:
+            addMessages(lines)
+        else:
+            for line in lines:
+                grades.addMessage(line)
+
     def testPass(self, grades: Any) -> bool:
         """Record a passing test."""
-        grades.addMessage(f'PASS: {self.path}')
-        for line in self.messages:
-            grades.addMessage(f'    {line}')
+        self.reportMessages(grades, [f'PASS: {self.path}'])
         return True
 
     def testFail(self, grades: Any) -> bool:
         """Record a failing test."""
-        grades.addMessage(f'FAIL: {self.path}')
-        for line in self.messages:
-            grades.addMessage(f'    {line}')
+        self.reportMessages(grades, [f'FAIL: {self.path}'])
         return False
 
     def testPartial(self, grades: Any, points: float, maxPoints: float) -> bool:
@@ -214,16 +280,15 @@ class TestCase:
         extraCredit = max(0, points - maxPoints)
         regularCredit = points - extraCredit
 
-        grades.addMessage(
+        header = [
             f'{"PASS" if points >= maxPoints else "FAIL"}: '
             f'{self.path} ({regularCredit} of {maxPoints} points)'
-        )
+        ]
         
         if extraCredit > 0:
-            grades.addMessage(f'EXTRA CREDIT: {extraCredit} points')
+            header.append(f'EXTRA CREDIT: {extraCredit} points')
 
-        for line in self.messages:
-            grades.addMessage(f'    {line}')
+        self.reportMessages(grades, header)
 
         return True
 
@@ -92,8 +92,9 @@ class NullGraphics(GameDisplay):
         return True
 
     def pause(self) -> None:
-        """Pause for configured time."""
-        time.sleep(self.config.sleep_time)
+        """Pause for configured time, skipping the sleep call when it is 0."""
+        if (sleep_time := self.config.sleep_time) > 0:
+            time.sleep(sleep_time)
 
     def draw(self, state: Any) -> None:
         """Print state if not quiet."""
@@ -147,9 +148,10 @@ class PacmanGraphics(GameDisplay):
         
         if self.agentCounter == 0:
             self.turn += 1
-            if self.config.display_moves:
+            config = self.config
+            if config.display_moves:
                 self._display_move_info(state, numAgents)
-            if self.turn % self.config.draw_every == 0:
+            if self.turn % config.draw_every == 0:
                 self.draw(state)
                 self.pause()
                 
@@ -163,11 +165,12 @@ class PacmanGraphics(GameDisplay):
             state: Current game state
             numAgents: Number of agents in game
         """
-        ghosts = [
-            pacman.nearestPoint(state.getGhostPosition(i))
-            for i in range(1, numAgents)
-        ]
-        pacman_pos = pacman.nearestPoint(state.getPacmanPosition())
+        nearestPoint = pacman.nearestPoint
+        ghosts = list(map(
+            nearestPoint,
+            map(state.getGhostPosition, range(1, numAgents))
+        ))
+        pacman_pos = nearestPoint(state.getPacmanPosition())
         
         print(
             f"{self.turn:4d}) P: {str(pacman_pos):<8} "
@@ -176,8 +179,9 @@ class PacmanGraphics(GameDisplay):
         )
 
     def pause(self) -> None:
-        """Pause for configured time."""
-        time.sleep(self.config.sleep_time)
+        """Pause for configured time, skipping the sleep call when it is 0."""
+        if (sleep_time := self.config.sleep_time) > 0:
+            time.sleep(sleep_time)
 
     def draw(self, state: Any) -> None:
         """Draw current state if not quiet.
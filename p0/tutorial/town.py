@@ -24,7 +24,8 @@ Changes:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional, Union
+from functools import lru_cache
+from typing import Callable, List, Dict, FrozenSet, Tuple, Optional, Union
 import shop
 from decimal import Decimal
 
@@ -32,6 +33,7 @@ from decimal import Decimal
 LocationPair = Tuple[str, str]
 OrderItem = Tuple[str, float]
 Route = List[str]
+RouteKey = FrozenSet[str]
 
 
 @dataclass
@@ -41,10 +43,29 @@ class Town:
     shops: List[shop.FruitShop]
     distances: Dict[LocationPair, float]
     _shop_names: List[str] = field(init=False)
+    _shops_by_name: Dict[str, shop.FruitShop] = field(
+        init=False, repr=False, compare=False
+    )
+    _route_costs: Dict[Tuple[str, RouteKey], Optional[float]] = field(
+        init=False, repr=False, compare=False
+    )
+    _dist: Dict[LocationPair, float] = field(
+        init=False, repr=False, compare=False
+    )
+    _route_total: Callable[[Tuple[str, ...]], float] = field(
+        init=False, repr=False, compare=False
+    )
     
     def __post_init__(self) -> None:
         """Validate and initialize after creation."""
         self._shop_names = [s.getName() for s in self.shops]
+        self._shops_by_name = dict(zip(self._shop_names, self.shops))
+        self._route_costs = {}
+        # Both orientations of every pair, with an explicitly given (a, b)
+        # winning over the mirror of (b, a) as the two-step lookup did
+        self._dist = {(b, a): d for (a, b), d in self.distances.items()}
+        self._dist.update(self.distances)
+        self._route_total = lru_cache(maxsize=4096)(self._compute_route_total)
         self._validate_distances()
 
     def _validate_distances(self) -> None:
@@ -71,17 +92,33 @@ class Town:
         Returns:
             Lowest cost per pound of fruit on route, or None if unavailable
         """
-        route_shops = [
-            shop for shop in self.shops 
-            if shop.getName() in route
-        ]
-        
+        return self._cost_for_fruit_on_routeset(fruit, frozenset(route))
+
+    def _cost_for_fruit_on_routeset(
+        self,
+        fruit: str,
+        route_key: RouteKey
+    ) -> Optional[float]:
+        """Memoized lowest cost per pound of fruit at a set of shops.
+
+        Shop prices are fixed once a shop is created, so results are cached
+        per town on (fruit, route_key).
+        """
+        key = (fruit, route_key)
+        try:
+            return self._route_costs[key]
+        except KeyError:
+            pass
+
+        shops_by_name = self._shops_by_name
         costs = [
-            cost for shop in route_shops
-            if (cost := shop.getCostPerPound(fruit)) is not None
+            cost for name in route_key
+            if name in shops_by_name
+            and (cost := shops_by_name[name].getCostPerPound(fruit)) is not None
         ]
-        
-        return min(costs) if costs else None
+
+        self._route_costs[key] = result = min(costs) if costs else None
+        return result
 
     def allFruitsCarriedAtShops(
         self, 
@@ -97,8 +134,9 @@ class Town:
         Returns:
             True if all fruits are available, False otherwise
         """
+        route_key = frozenset(shops)
         return all(
-            self.getFruitCostPerPoundOnRoute(fruit, shops) is not None
+            self._cost_for_fruit_on_routeset(fruit, route_key) is not None
             for fruit, _ in orderList
         )
 
@@ -116,11 +154,7 @@ class Town:
             KeyError: If distance between locations is not defined
         """
         try:
-            return (
-                self.distances[(loc1, loc2)]
-                if (loc1, loc2) in self.distances
-                else self.distances[(loc2, loc1)]
-            )
+            return self._dist[(loc1, loc2)]
         except KeyError:
             raise KeyError(f"No distance defined between {loc1} and {loc2}")
 
@@ -135,18 +169,19 @@ class Town:
         """
         if not route:
             return 0.0
+        return self._route_total(tuple(route))
+
+    def _compute_route_total(self, route: Tuple[str, ...]) -> float:
+        """Total distance of a non-empty route; memoized per town."""
+        getDistance = self.getDistance
+        total = getDistance('home', route[0])
 
-        total = self.getDistance('home', route[0])
-        
         # Add distances between consecutive shops
-        total += sum(
-            self.getDistance(route[i], route[i + 1])
-            for i in range(len(route) - 1)
-        )
-        
+        total += sum(map(getDistance, route, route[1:]))
+
         # Add return trip
-        total += self.getDistance(route[-1], 'home')
-        
+        total += getDistance(route[-1], 'home')
+
         return total
 
     def getPriceOfOrderOnRoute(
@@ -165,13 +200,22 @@ class Town:
         Returns:
             Total cost including gas, or None if any fruit unavailable
         """
+        # Look up fruit prices first so routes missing a fruit are rejected
+        # before any distance work is done. Pounds are converted to float
+        # once here, so Decimal quantities price like the float prices do.
+        route_key = frozenset(route)
+        cost_on_route = self._cost_for_fruit_on_routeset
+        items = []
+        for fruit, numPounds in orderList:
+            if (cost_per_pound := cost_on_route(fruit, route_key)) is None:
+                return None
+            items.append((float(numPounds), cost_per_pound))
+
         # Calculate travel cost
         total_cost = self.getTotalDistanceOnRoute(route) * float(gasCost)
         
         # Add fruit costs
-        for fruit, numPounds in orderList:
-            if (cost_per_pound := self.getFruitCostPerPoundOnRoute(fruit, route)) is None:
-                return None
+        for numPounds, cost_per_pound in items:
             total_cost += numPounds * cost_per_pound
             
         return total_cost
@@ -15,20 +15,111 @@ Student side autograding was added by Brad Miller, Nick Hay, and
 Pieter Abbeel (pabbeel@cs.berkeley.edu).
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Union
+from types import CodeType
+import hashlib
+import json
 
 import testClasses
 from testClasses import TestCase, Question
 
+# Results of EvalTest.evalCode keyed by (preamble, test, id(moduleDict)).
+# Each entry keeps a reference to its moduleDict so the id cannot be reused
+# by another dict while the entry is alive.
+_EVAL_CACHE: Dict[Tuple[str, str, int], Tuple[Dict[str, Any], str]] = {}
 
-@dataclass
+# Results persisted across runs, keyed by submission and test hashes.
+# Off unless the autograder is run with --cache-results; None when disabled.
+RESULT_CACHE_PATH = Path('.autograder_cache.json')
+_result_cache: Optional[Dict[str, str]] = None
+
+
+@lru_cache(maxsize=None)
+def _source_hash(directories: Tuple[str, ...]) -> str:
+    """BLAKE2b digest of every Python source file in the given directories."""
+    digest = hashlib.blake2b()
+    for directory in directories:
+        for path in sorted(Path(directory).glob('*.py')):
+            digest.update(path.name.encode('utf-8') + b'\0')
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _submission_hash(moduleDict: Dict[str, Any]) -> str:
+    """Hash the sources of the student's code.
+
+    Whole directories are hashed rather than just the loaded modules,
+    since those import their siblings (shopSmart imports shop, say).
+    """
+    directories = {
+        str(Path(module.__file__).resolve().parent)
+        for module in moduleDict.values()
+        if getattr(module, '__file__', None)
+    }
+    return _source_hash(tuple(sorted(directories)))
+
+
+def enableResultCache(moduleDict: Dict[str, Any]) -> None:
+    """Load persisted results for the current submission and start caching.
+
+    Entries recorded against any other version of the student's sources
+    are dropped, so the file never holds more than one submission.
+
+    Args:
+        moduleDict: Dictionary of module bindings for the submission
+    """
+    global _result_cache
+    prefix = f'{_submission_hash(moduleDict)}:'
+    try:
+        stored = json.loads(RESULT_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        stored = {}
+    if not isinstance(stored, dict):
+        stored = {}
+    _result_cache = {
+        key: result for key, result in stored.items()
+        if key.startswith(prefix) and isinstance(result, str)
+    }
+
+
+def saveResultCache() -> None:
+    """Write the result cache back to disk once grading has finished."""
+    if _result_cache is None:
+        return
+    try:
+        RESULT_CACHE_PATH.write_text(json.dumps(_result_cache), encoding='utf-8')
+    except OSError:
+        # Caching is best effort; a read-only tree just reruns tests
+        pass
+
+
+def _compile(source: str, filename: str, mode: str) -> Union[CodeType, str]:
+    """Compile test source once, leaving it as text if it does not parse.
+
+    Returning the text lets the SyntaxError surface from evalCode with the
+    usual error message instead of while the test is being loaded.
+    """
+    try:
+        return compile(source, filename, mode)
+    except SyntaxError:
+        return source
+
+
+@dataclass(slots=True)
 class EvalTest(TestCase):
     """Test case that evaluates Python code and compares the output to a solution."""
     
     question: Question
     testDict: Dict[str, Any]
+    preamble: str = field(init=False)
+    test: str = field(init=False)
+    success: str = field(init=False)
+    failure: str = field(init=False)
+    _preambleCode: Optional[Union[CodeType, str]] = field(init=False, repr=False)
+    _testCode: Union[CodeType, str] = field(init=False, repr=False)
     
     def __post_init__(self):
         """Initialize test case attributes from testDict."""
@@ -36,6 +127,24 @@ class EvalTest(TestCase):
         self.test = self.testDict.get('test', '')
         self.success = self.testDict.get('success', '')
         self.failure = self.testDict.get('failure', '')
+        # Name the code after the test file so tracebacks point at the test
+        path = self.testDict.get('path', '')
+        self._preambleCode = (
+            _compile(self.preamble, f'<{path}:preamble>', 'exec')
+            if self.preamble else None
+        )
+        self._testCode = _compile(self.test, f'<{path}:test>', 'eval')
+
+    def resultCacheKey(self, moduleDict: Dict[str, Any]) -> str:
+        """Key for this test's persisted result against the given submission."""
+        source = '\0'.join((self.preamble, self.test, self.testDict['path']))
+        test_hash = hashlib.blake2b(source.encode('utf-8')).hexdigest()
+        return f'{_submission_hash(moduleDict)}:{test_hash}'
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop cached results, e.g. after student modules are reloaded."""
+        _EVAL_CACHE.clear()
 
     def evalCode(self, moduleDict: Dict[str, Any]) -> str:
         """
@@ -50,20 +159,27 @@ class EvalTest(TestCase):
         Raises:
             Exception: If evaluation fails
         """
+        key = (self.preamble, self.test, id(moduleDict))
+        cached = _EVAL_CACHE.get(key)
+        if cached is not None:
+            return cached[1]
+
         bindings = dict(moduleDict)
         
         # Execute preamble if it exists
-        if self.preamble:
+        if self._preambleCode is not None:
             try:
-                exec(self.preamble, bindings)
+                exec(self._preambleCode, bindings)
             except Exception as e:
                 raise Exception(f"Error in preamble: {str(e)}")
                 
         # Execute test code
         try:
-            return str(eval(self.test, bindings))
+            result = str(eval(self._testCode, bindings))
         except Exception as e:
             raise Exception(f"Error evaluating test: {str(e)}")
+        _EVAL_CACHE[key] = (moduleDict, result)
+        return result
 
     def execute(self, grades: Any, moduleDict: Dict[str, Any], solutionDict: Dict[str, Any]) -> bool:
         """
@@ -77,7 +193,13 @@ class EvalTest(TestCase):
         Returns:
             True if test passes, False otherwise
         """
-        result = self.evalCode(moduleDict)
+        if _result_cache is None:
+            result = self.evalCode(moduleDict)
+        else:
+            # Reuse the result from an earlier run against identical sources
+            key = self.resultCacheKey(moduleDict)
+            if (result := _result_cache.get(key)) is None:
+                result = _result_cache[key] = self.evalCode(moduleDict)
         solution = solutionDict.get('result', '')
         
         if result == solution:
@@ -122,6 +244,8 @@ class EvalTest(TestCase):
 
 class TestCase(testClasses.TestCase):
     """Base test case class that provides common functionality."""
+
+    __slots__ = ('maxPoints',)
     
     def __init__(self, question: Question, testDict: Dict[str, Any]):
         """
@@ -16,18 +16,22 @@ Pieter Abbeel (pabbeel@cs.berkeley.edu).
 """
 
 from __future__ import annotations
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from typing import (
     Any, Dict, List, Optional, Tuple, Union, TypeVar, 
-    Generic, Callable, Iterator, DefaultDict
+    Generic, Callable, Iterable, Iterator, DefaultDict, Deque
 )
-import heapq
+from contextlib import contextmanager
+from itertools import repeat
+from operator import truediv
+from heapq import heapify, heappop, heappush
 import inspect
 import random
+import _thread
 import signal
 import sys
-import time
+import threading
 
 T = TypeVar('T')
 K = TypeVar('K')
@@ -36,6 +40,8 @@ V = TypeVar('V')
 class Stack(Generic[T]):
     """A container with a last-in-first-out (LIFO) queuing policy."""
 
+    __slots__ = ('list',)
+
     def __init__(self) -> None:
         self.list: List[T] = []
 
@@ -53,21 +59,27 @@ class Stack(Generic[T]):
 
 
 class Queue(Generic[T]):
-    """A container with a first-in-first-out (FIFO) queuing policy."""
+    """A container with a first-in-first-out (FIFO) queuing policy.
+
+    Push and pop are O(1): the backing store is a collections.deque, which
+    avoids the O(n) shift that list.insert(0, item) makes on every push.
+    """
+
+    __slots__ = ('list',)
 
     def __init__(self) -> None:
-        self.list: List[T] = []
+        self.list: Deque[T] = deque()
 
     def push(self, item: T) -> None:
         """Enqueue the 'item' into the queue."""
-        self.list.insert(0, item)
+        self.list.append(item)
 
     def pop(self) -> T:
         """
         Dequeue the earliest enqueued item still in the queue.
         This operation removes the item from the queue.
         """
-        return self.list.pop()
+        return self.list.popleft()
 
     def isEmpty(self) -> bool:
         """Returns true if the queue is empty."""
@@ -82,20 +94,30 @@ class PriorityQueue(Generic[T]):
     usually interested in quick retrieval of the lowest-priority item in the queue.
     """
 
-    def __init__(self) -> None:
-        self.heap: List[Tuple[float, int, T]] = []
-        self.count: int = 0
+    __slots__ = ('heap', 'count', 'DONE')
+
+    def __init__(self, items: Iterable[Tuple[float, T]] = ()) -> None:
+        """Create a queue, optionally bulk-loaded with (priority, item) pairs.
+
+        A bulk load is heapified once in O(n) rather than pushed one item at
+        a time; items pop in the same order either way.
+        """
+        self.heap: List[Tuple[float, int, T]] = [
+            (priority, count, item)
+            for count, (priority, item) in enumerate(items)
+        ]
+        heapify(self.heap)
+        self.count: int = len(self.heap)
         self.DONE = -100000
 
     def push(self, item: T, priority: float) -> None:
         """Add item with given priority."""
-        entry = (priority, self.count, item)
-        heapq.heappush(self.heap, entry)
+        heappush(self.heap, (priority, self.count, item))
         self.count += 1
 
     def pop(self) -> T:
         """Pop and return the item with lowest priority."""
-        (_, _, item) = heapq.heappop(self.heap)
+        (_, _, item) = heappop(self.heap)
         return item
 
     def isEmpty(self) -> bool:
@@ -110,14 +132,26 @@ class PriorityQueueWithFunction(PriorityQueue[T]):
     those two classes. The caller has to provide a priority function, which
     extracts each item's priority.
     """
-    def __init__(self, priorityFunction: Callable[[T], float]):
-        """priorityFunction (item) -> priority"""
+
+    __slots__ = ('priorityFunction', 'boundArgs')
+
+    def __init__(self, priorityFunction: Callable[..., float], *boundArgs: Any):
+        """priorityFunction (item, *boundArgs) -> priority
+
+        Extra arguments are passed to priorityFunction after the item, so
+        PriorityQueueWithFunction(heuristic, problem) replaces a wrapper
+        like lambda item: heuristic(item, problem) and its extra call.
+        """
         super().__init__()
         self.priorityFunction = priorityFunction
+        self.boundArgs = boundArgs
 
     def push(self, item: T, priority: Optional[float] = None) -> None:
         """Adds an item to the queue with priority from the priority function."""
-        super().push(item, self.priorityFunction(item))
+        # Same as PriorityQueue.push, inlined to save a call per push
+        priority = self.priorityFunction(item, *self.boundArgs)
+        heappush(self.heap, (priority, self.count, item))
+        self.count += 1
 
 
 @dataclass
@@ -140,31 +174,34 @@ class Counter(Dict[K, Union[int, float]]):
         if items is None:
             return
             
+        get = self.get
         if isinstance(items, dict):
             for key, count in items.items():
-                self[key] = self.get(key, 0) + count
+                self[key] = get(key, 0) + count
         else:
             for item in items:
-                self[item] = self.get(item, 0) + 1
+                self[item] = get(item, 0) + 1
 
     def incrementAll(self, keys: List[K], count: Union[int, float]) -> None:
         """Increments all elements of keys by the same count."""
+        get = self.get
         for key in keys:
-            self[key] = self.get(key, 0) + count
+            self[key] = get(key, 0) + count
 
     def argMax(self) -> Optional[K]:
         """Returns the key with the highest value."""
         if not self:
             return None
-        all_items = self.items()
-        values = [x[1] for x in all_items]
-        maxIndex = values.index(max(values))
-        return list(all_items)[maxIndex][0]
+        # max keeps the first of several equal values, as before
+        return max(self, key=self.get)
 
     def sortedKeys(self) -> List[K]:
         """Returns a list of keys sorted by their values."""
-        sortedItems = sorted(self.items(), key=lambda x: (-x[1], x[0]))
-        return [x[0] for x in sortedItems]
+        # Sort (-value, key) pairs directly: highest value first, ties broken
+        # by key, without calling a key function per item
+        decorated = [(-value, key) for key, value in self.items()]
+        decorated.sort()
+        return [key for _, key in decorated]
 
     def totalCount(self) -> Union[int, float]:
         """Returns the sum of counts for all keys."""
@@ -175,13 +212,14 @@ class Counter(Dict[K, Union[int, float]]):
         total = float(self.totalCount())
         if total == 0:
             return
-        for key in self:
-            self[key] = self[key] / total
+        self.divideAll(total)
 
     def divideAll(self, divisor: Union[int, float]) -> None:
         """Divides all counts by divisor."""
-        for key in self:
-            self[key] /= divisor
+        # Divide every value in one C-level pass and write the results back
+        # with dict.update (Counter.update would add to the old counts).
+        # Only values change, so iterating the keys meanwhile is safe.
+        dict.update(self, zip(self, map(truediv, self.values(), repeat(divisor))))
 
     def copy(self) -> 'Counter[K]':
         """Returns a copy of the counter."""
@@ -210,6 +248,8 @@ class TimeoutFunctionException(Exception):
 class TimeoutFunction:
     """Function wrapper that raises a TimeoutFunctionException after timeout."""
 
+    __slots__ = ('timeout', 'function')
+
     def __init__(self, function: Callable, timeout: int):
         self.timeout = timeout
         self.function = function
@@ -224,17 +264,32 @@ class TimeoutFunction:
             old_handler = signal.signal(signal.SIGALRM, self.handle_timeout)
             signal.alarm(self.timeout)
             try:
-                result = self.function(*args, **kwargs)
+                return self.function(*args, **kwargs)
             finally:
+                # Disarm before restoring the handler, and on every exit, so
+                # a pending alarm never reaches the previous handler
+                signal.alarm(0)
                 signal.signal(signal.SIGALRM, old_handler)
-            signal.alarm(0)
-        else:
-            start_time = time.time()
-            result = self.function(*args, **kwargs)
-            time_elapsed = time.time() - start_time
-            if time_elapsed >= self.timeout:
-                self.handle_timeout(None, None)
-        return result
+
+        # No SIGALRM (Windows): interrupt the main thread from a timer and
+        # turn that interrupt into a timeout
+        fired = threading.Event()
+
+        def interrupt() -> None:
+            fired.set()
+            _thread.interrupt_main()
+
+        timer = threading.Timer(self.timeout, interrupt)
+        timer.daemon = True
+        timer.start()
+        try:
+            return self.function(*args, **kwargs)
+        except KeyboardInterrupt:
+            if fired.is_set():
+                raise TimeoutFunctionException() from None
+            raise
+        finally:
+            timer.cancel()
 
 
 # Global print muting functionality
@@ -244,10 +299,25 @@ _MUTED: bool = False
 
 class WritableNull:
     """A write-only null device."""
-    def write(self, string: str) -> None:
+
+    __slots__ = ()
+
+    def write(self, string: str) -> int:
         """Discard output."""
+        return len(string)
+
+    def flush(self) -> None:
+        """Nothing is buffered, so there is nothing to flush."""
         pass
 
+    def writable(self) -> bool:
+        """Report the stream as writable, as a real stdout would be."""
+        return True
+
+    def isatty(self) -> bool:
+        """A null device is never a terminal."""
+        return False
+
 
 def mutePrint() -> None:
     """Mute print output."""
@@ -268,17 +338,40 @@ def unmutePrint() -> None:
     sys.stdout = _ORIGINAL_STDOUT
 
 
+@contextmanager
+def muted() -> Iterator[None]:
+    """Mute print output for the duration of a with block.
+
+    Works with mutePrint/unmutePrint: entering an already muted section
+    leaves it muted on exit, and output is restored even if the block
+    raises.
+    """
+    wasMuted = _MUTED
+    mutePrint()
+    try:
+        yield
+    finally:
+        if not wasMuted:
+            unmutePrint()
+
+
 class FixedRandom:
     """Random number generator with a fixed seed for reproducibility."""
+
+    __slots__ = ('_seed', '_random', '_initialState')
     
     def __init__(self):
         self._seed = 0
-        self._random = random.Random()
-        self._random.seed(self._seed)
+        self._random = random.Random(self._seed)
+        self._initialState = self._random.getstate()
         
     def reset(self) -> None:
-        """Reset the random number generator to its initial state."""
-        self._random.seed(self._seed)
+        """Reset the random number generator to its initial state.
+
+        Restores the state captured after seeding, which is cheaper than
+        seeding again and yields the same sequence.
+        """
+        self._random.setstate(self._initialState)
         
     def random(self) -> float:
         """Return the next random number."""